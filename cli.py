@@ -1,21 +1,22 @@
 """Cli interface"""
+import asyncio
 import logging
 import sys
-from io import StringIO
 
 from robotsline import bootstrap
 from robotsline.cli import ia_adapter, interactive_adapter
-from robotsline.cli.screen import Cli
+from robotsline.cli.screen import Cli, TailHandler
 
-_logs = StringIO()
-logging.basicConfig(
-    level="NOTSET",
-    format="%(message)s",
-    handlers=[logging.StreamHandler(_logs)],
-)
+_logs = TailHandler()
+_logs.setFormatter(logging.Formatter("%(message)s"))
 
 
 def main(interactive: bool):
+    # Only errors are worth a line in the logs panel when watching the IA
+    logging.basicConfig(
+        level=logging.INFO if interactive else logging.ERROR,
+        handlers=[_logs],
+    )
     game = bootstrap.Game()
     cli = Cli(game, _logs)
 
@@ -24,7 +25,7 @@ def main(interactive: bool):
         cli.interactive_run(director)
     else:
         director = ia_adapter.get_director(game)
-        cli.live_run(director)
+        asyncio.run(cli.live_run(director))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 from . import commands, handlers, models
-from .settings import Settings
+from .settings import DEFAULT_SETTINGS, Settings
 
 
 class Game:
-    def __init__(self, settings: Settings = Settings()):
+    def __init__(self, settings: Settings = DEFAULT_SETTINGS):
         self.factory = models.RoboticFactory.from_settings(settings)
 
     def execute(self, command: commands.Command) -> None:
@@ -1,85 +1,71 @@
-import time
-from itertools import cycle
-from typing import Iterable, Iterator
+import asyncio
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
 
 from .. import bootstrap, commands, models
 
+# A decision is the next command to run, if any robot is available for it
+Decision = Optional[commands.Command]
+
+_GHOST = models.Robot.ghost()
+
 
 def _idle_robots(stock: models.Stock) -> Iterator[models.Robot]:
-    return (robot for robot in stock.robots if robot.status == "Idle")
+    return iter(stock.idle_robots())
 
 
 def _get_idle_robot_at(stock: models.Stock, location: models.Location) -> models.Robot:
-    idle_robots = (
-        robot for robot in _idle_robots(stock) if robot.state.location is location
-    )
-    return next(idle_robots, models.Robot.ghost())
+    return next(iter(stock.idle_robots_at(location)), _GHOST)
 
 
-def _move_idle_robot_to(
-    stock: models.Stock, destination: models.Location
-) -> Iterable[commands.Command]:
-    robot = next(_idle_robots(stock), models.Robot.ghost())
+def _move_idle_robot_to(stock: models.Stock, destination: models.Location) -> Decision:
+    robot = next(_idle_robots(stock), _GHOST)
     if robot:
-        yield commands.MoveRobot(robot_id=robot.id_, destination=destination.value)
+        return commands.MoveRobot(robot_id=robot.id_, destination=destination.label)
+    return None
+
 
+def _work_at(
+    stock: models.Stock,
+    location: models.Location,
+    activity: Callable[..., commands.Command],
+) -> Decision:
+    """Start the activity with a robot already there, or bring one"""
+    worker = _get_idle_robot_at(stock, location)
+    if worker:
+        return activity(robot_id=worker.id_)
+    return _move_idle_robot_to(stock, location)
 
-def _extract_foo(stock: models.Stock) -> Iterable[commands.Command]:
-    extractor = _get_idle_robot_at(stock, models.Location.FOO_MINE)
-    if extractor:
-        yield commands.Mine(robot_id=extractor.id_, material="foo")
-    else:
-        yield from _move_idle_robot_to(stock, models.Location.FOO_MINE)
 
+def _extract_foo(stock: models.Stock) -> Decision:
+    return _work_at(stock, models.Location.FOO_MINE, commands.Mine.Foo)
 
-def _extract_bar(stock: models.Stock) -> Iterable[commands.Command]:
-    extractor = _get_idle_robot_at(stock, models.Location.BAR_MINE)
-    if extractor:
-        yield commands.Mine(robot_id=extractor.id_, material="bar")
-    else:
-        yield from _move_idle_robot_to(stock, models.Location.BAR_MINE)
 
+def _extract_bar(stock: models.Stock) -> Decision:
+    return _work_at(stock, models.Location.BAR_MINE, commands.Mine.Bar)
 
-def _assemble_foobars(stock: models.Stock) -> Iterable[commands.Command]:
+
+def _assemble_foobars(stock: models.Stock) -> Decision:
     if stock.has_enough_material():
-        assembler = _get_idle_robot_at(stock, models.Location.ASSEMBLY_LINE)
-        if assembler:
-            yield commands.Assemble(robot_id=assembler.id_)
-        else:
-            yield from _move_idle_robot_to(stock, models.Location.ASSEMBLY_LINE)
-    else:
-        if not stock.foos:
-            yield from _extract_foo(stock)
-        if not stock.bars:
-            yield from _extract_bar(stock)
+        return _work_at(stock, models.Location.ASSEMBLY_LINE, commands.Assemble)
+    if not stock.foos:
+        return _extract_foo(stock)
+    return _extract_bar(stock)
 
 
-def _sell_materials(stock: models.Stock) -> Iterable[commands.Command]:
+def _sell_materials(stock: models.Stock) -> Decision:
     if stock.foobars:
-        seller = _get_idle_robot_at(stock, models.Location.MATERIAL_STORE)
-        if seller:
-            yield commands.SellFoobars(robot_id=seller.id_)
-        else:
-            yield from _move_idle_robot_to(stock, models.Location.MATERIAL_STORE)
-    else:
-        yield from _assemble_foobars(stock)
+        return _work_at(stock, models.Location.MATERIAL_STORE, commands.SellFoobars)
+    return _assemble_foobars(stock)
 
 
-def _purchase_robot(
-    stock: models.Stock, settings: models.Settings
-) -> Iterable[commands.Command]:
-    required_money, required_foos = settings.robot_cost
-    if stock.can_buy_robot(required_money, required_foos):
-        buyer = _get_idle_robot_at(stock, models.Location.ROBOTS_STORE)
-        if buyer:
-            yield commands.BuyRobot(robot_id=buyer.id_)
-        else:
-            yield from _move_idle_robot_to(stock, models.Location.ROBOTS_STORE)
-    else:
-        if required_money > stock.money:
-            yield from _sell_materials(stock)
-        if required_foos > len(stock.foos):
-            yield from _extract_foo(stock)
+def _purchase_robot(stock: models.Stock, settings: models.Settings) -> Decision:
+    required_money_cents = settings.robot_cost_cents
+    required_foos = settings.robot_cost_foos
+    if stock.can_buy_robot(required_money_cents, required_foos):
+        return _work_at(stock, models.Location.ROBOTS_STORE, commands.BuyRobot)
+    if required_money_cents > stock.money_cents:
+        return _sell_materials(stock)
+    return _extract_foo(stock)
 
 
 def _ia_director(
@@ -97,37 +83,51 @@ def _low_robots_strategy(
     stock: models.Stock, settings: models.Settings
 ) -> Iterable[commands.Command]:
     """Naive strategy is to give priority of robots purchase."""
-    yield from _purchase_robot(stock, settings)
+    decision = _purchase_robot(stock, settings)
+    if decision:
+        yield decision
     while next(_idle_robots(stock), False):
-        yield from _extract_foo(stock)
-        yield from _extract_bar(stock)
+        for extract in (_extract_foo, _extract_bar):
+            decision = extract(stock)
+            if decision:
+                yield decision
+
+
+_ACTIVITIES: dict[models.Location, Callable[..., commands.Command]] = {
+    models.Location.FOO_MINE: commands.Mine.Foo,
+    models.Location.BAR_MINE: commands.Mine.Bar,
+    models.Location.ASSEMBLY_LINE: commands.Assemble,
+    models.Location.MATERIAL_STORE: commands.SellFoobars,
+}
+_ACTIVITIES_CYCLE = tuple(_ACTIVITIES)
 
 
 def _high_robots_strategy(
     stock: models.Stock, settings: models.Settings
 ) -> Iterable[commands.Command]:
     """We place a robot on strategic places to minimize movement"""
-    locations_activity = {
-        models.Location.FOO_MINE: commands.Mine.Foo,
-        models.Location.BAR_MINE: commands.Mine.Bar,
-        models.Location.ASSEMBLY_LINE: commands.Assemble,
-        models.Location.MATERIAL_STORE: commands.SellFoobars,
-    }
     # Just 1 seller is needed
     seller, robot_store = stock.robots[0], models.Location.ROBOTS_STORE
     if seller.state.location is not robot_store:
-        yield commands.MoveRobot(robot_id=seller.id_, destination=robot_store.value)
+        yield commands.MoveRobot(robot_id=seller.id_, destination=robot_store.label)
     yield commands.BuyRobot(robot_id=seller.id_)
 
-    for robot, location in zip(stock.robots[1:], cycle(locations_activity)):
-        if robot.state.location is not location and robot.status == "Idle":
-            yield commands.MoveRobot(robot_id=robot.id_, destination=location.value)
-    for robot in stock.robots:
-        if robot.state.location in locations_activity:
-            yield locations_activity[robot.state.location](robot_id=robot.id_)
-
-
-def get_director(game: bootstrap.Game) -> Iterable[tuple[commands.Command, str]]:
+    # Other robots are dispatched round robin on the activities, in a single pass
+    for index, robot in enumerate(stock.robots):
+        location = robot.state.location
+        if index and robot.is_idle:
+            target = _ACTIVITIES_CYCLE[(index - 1) % len(_ACTIVITIES_CYCLE)]
+            if location is not target:
+                yield commands.MoveRobot(robot_id=robot.id_, destination=target.label)
+                continue
+        if location in _ACTIVITIES:
+            yield _ACTIVITIES[location](robot_id=robot.id_)
+
+
+async def get_director(
+    game: bootstrap.Game,
+) -> AsyncIterator[tuple[commands.Command, str]]:
+    """Pace the IA commands without blocking the event loop"""
     for cmd in _ia_director(game.factory.stock, game.factory.settings):
         yield cmd, str(cmd)
-        time.sleep(0.1)
+        await asyncio.sleep(0.1)
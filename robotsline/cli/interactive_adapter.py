@@ -22,6 +22,17 @@ class _InteractiveDirector:
         self.game = game
         self.gui = gui
 
+        # The menu never changes: format it once
+        choices = range(1, len(self.interactive_commands) + 1)
+        self._menu_text = "\n".join(
+            self._cmd_instruction(choice, cmd)
+            for choice, cmd in zip(choices, self.interactive_commands)
+        )
+        self._menu_choices = [str(choice) for choice in choices]
+        self._cmd_params = {
+            cmd: list(cmd.__annotations__.items()) for cmd in self.interactive_commands
+        }
+
     def commands_gen(self) -> Iterable[tuple[commands.Command, str]]:
         """Generator of command to pilot the game"""
         while True:
@@ -30,9 +41,8 @@ class _InteractiveDirector:
 
     def _build_cmd(self, cmd_id: int):
         cmd_type = self.interactive_commands[cmd_id]
-        cmd_params = cmd_type.__annotations__
         kwargs = {}
-        for arg_name, arg_type in cmd_params.items():
+        for arg_name, arg_type in self._cmd_params[cmd_type]:
             self.gui.refresh(f"Enter a valid {arg_type.__name__} for {arg_name}")
             kwargs[arg_name] = self._ask(arg_type)
         instance = cmd_type(**kwargs)
@@ -44,15 +54,8 @@ class _InteractiveDirector:
         return prompt.ask("", console=self.gui.console, **kwargs)
 
     def _ask_command_id(self) -> int:
-        choices = range(1, len(self.interactive_commands) + 1)
-        instructions = "\n".join(
-            self._cmd_instruction(choice, cmd)
-            for choice, cmd in zip(choices, self.interactive_commands)
-        )
-        self.gui.refresh(instructions)
-        choice = IntPrompt.ask(
-            "", choices=[str(c) for c in choices], console=self.gui.console
-        )
+        self.gui.refresh(self._menu_text)
+        choice = IntPrompt.ask("", choices=self._menu_choices, console=self.gui.console)
         return choice - 1
 
     @staticmethod
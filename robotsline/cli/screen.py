@@ -1,6 +1,8 @@
+import collections
+import functools
+import logging
 from datetime import timedelta
-from io import StringIO
-from typing import Iterable
+from typing import AsyncIterable, Iterable
 
 from rich.columns import Columns
 from rich.console import Console
@@ -12,105 +14,133 @@ from rich.text import TextType
 from robotsline import exceptions
 from robotsline.bootstrap import Game
 from robotsline.commands import Command
-from robotsline.models import Robot, Stock
+from robotsline.models import Location, Robot, RobotId, Stock
 
 GameDirector = Iterable[tuple[Command, str]]
+AsyncGameDirector = AsyncIterable[tuple[Command, str]]
+
+
+class TailHandler(logging.Handler):
+    """Keep only the last formatted log lines"""
+
+    def __init__(self, size: int = 6) -> None:
+        super().__init__()
+        self.lines: collections.deque[str] = collections.deque(maxlen=size)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+@functools.lru_cache(maxsize=256)
+def _robot_panel(robot_id: RobotId, status: str) -> Panel:
+    """Panels only depend on id and status, so they can be shared between frames"""
+    return Panel(
+        f"🤖 {robot_id} [b]{status}",
+        style="Green" if status == "Idle" else "Red",
+    )
 
 
 class Cli:
     """Gui representation of a stock"""
 
-    def __init__(self, game: Game, logs: StringIO):
+    def __init__(self, game: Game, logs: TailHandler):
         self.console = Console()
         self.game = game
 
         self.locations = [
-            "cafeteria",
-            "foo mine",
-            "bar mine",
-            "assembly line",
-            "material store",
-            "robots store",
-            "on my way",
+            Location.CAFETERIA,
+            Location.FOO_MINE,
+            Location.BAR_MINE,
+            Location.ASSEMBLY_LINE,
+            Location.MATERIAL_STORE,
+            Location.ROBOTS_STORE,
+            Location.ON_MY_WAY,
         ]
         self.logs = logs
 
+        # The screen skeleton is built once, only its leaves are updated
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(name="resources", size=2),
+            Layout(name="locations"),
+            Layout(name="events", size=10),
+        )
+        self._layout["events"].split_row(
+            Layout(name="instructions"), Layout(name="logs")
+        )
+        self._locations_signatures: dict[Location, tuple] = {}
+        self._locations_panels: dict[Location, Panel] = {}
+
     @property
     def stock(self) -> Stock:
         return self.game.factory.stock
 
     @staticmethod
-    def _robots_at_location(robots: list[Robot], location: str) -> Columns:
-        def robot_to_panel(robot):
-            return Panel(
-                f"🤖 {robot.id_} [b]{robot.status}",
-                style="Green" if robot.status == "Idle" else "Red",
-            )
-
-        robots_panels = [robot_to_panel(robot) for robot in robots]
+    def _robots_at_location(robots: list[Robot], location: Location) -> Columns:
+        robots_panels = [_robot_panel(robot.id_, robot.status) for robot in robots]
         if not robots_panels:
             robots_panels = [Panel("👻 Nothing here 👻", style="White")]
-        return Columns(robots_panels, title=f"[b]{location.upper()}")
+        return Columns(robots_panels, title=f"[b]{location.label.upper()}")
 
-    def _location(self, location: str) -> Panel:
-        robots = [robot for robot in self.stock.robots if robot.location == location]
+    def _location(self, location: Location, robots: list[Robot]) -> Panel:
         return Panel(
             self._robots_at_location(robots, location=location),
-            style="Black" if location == "on my way" else "Purple",
+            style="Black" if location is Location.ON_MY_WAY else "Purple",
             width=30,
         )
 
-    def _locations(self) -> Columns:
-        locations_views = [self._location(location) for location in self.locations]
-        return Columns(locations_views, title="[b]LOCATIONS", expand=False, equal=True)
+    def _update_locations(self) -> None:
+        """Rebuild the panels of the locations whose robots changed"""
+        changed = False
+        for location in self.locations:
+            robots = self.stock.robots_at(location)
+            signature = tuple((robot.id_, robot.status) for robot in robots)
+            if self._locations_signatures.get(location) != signature:
+                self._locations_signatures[location] = signature
+                self._locations_panels[location] = self._location(location, robots)
+                changed = True
+        if changed:
+            locations_views = list(self._locations_panels.values())
+            self._layout["locations"].update(
+                Columns(locations_views, title="[b]LOCATIONS", expand=False, equal=True)
+            )
 
-    def _resources(self) -> Layout:
+    def _resources(self) -> Columns:
         timeleft = timedelta(seconds=self.game.factory.seconds_left)
         resources = [
-            f"[b]FOOS:[/b] {len(self.stock.foos)}",
-            f"[b]BARS:[/b] {len(self.stock.bars)}",
+            f"[b]FOOS:[/b] {self.stock.foos}",
+            f"[b]BARS:[/b] {self.stock.bars}",
             f"[b]FOOBARS:[/b] {len(self.stock.foobars)}",
             f"[b]💰[/b] ${self.stock.money}",
             f"[b]🤖[/b] {len(self.stock.robots)}",
             f"[b]⏲[/b] {timeleft}",
         ]
-        columns = Columns(resources, title="[b]RESOURCES", expand=True)
-        return Layout(columns, size=2)
+        return Columns(resources, title="[b]RESOURCES", expand=True)
 
     @staticmethod
     def _instructions(instructions: TextType) -> Panel:
         return Panel(instructions, title="[b]ℹ️ INSTRUCTIONS")
 
     def _logs(self) -> Panel:
-        last_logs = self.logs.getvalue().splitlines()[-6:]
-        displayed_logs = "\n".join(last_logs)
+        displayed_logs = "\n".join(self.logs.lines)
         return Panel(f"[b red]{displayed_logs}", title="[b]💻 LOGS")
 
-    def _main_layout(self) -> Layout:
-        main_layout = Layout()
-        main_layout.split_column(
-            self._resources(), self._locations(), Layout(name="events", size=10)
-        )
-        main_layout["events"].split_row(
-            Layout(name="instructions"), Layout(self._logs(), name="logs")
-        )
-        return main_layout
-
     def main_layout(self, instructions: TextType) -> Layout:
-        """Build the entire screen"""
-        layout = self._main_layout()
-        layout["instructions"].update(self._instructions(instructions))
-        layout["logs"].update(self._logs())
-        return layout
+        """Update the screen and return it"""
+        self._layout["resources"].update(self._resources())
+        self._update_locations()
+        self._layout["instructions"].update(self._instructions(instructions))
+        self._layout["logs"].update(self._logs())
+        return self._layout
 
     def refresh(self, instructions: TextType):
         """Manually refresh the screen"""
         self.console.print(self.main_layout(instructions))
 
-    def live_run(self, director: GameDirector):
+    async def live_run(self, director: AsyncGameDirector):
         """Run game in auto refresh mode"""
         with Live(self.main_layout("")) as live:
-            for cmd, instructions in director:
+            async for cmd, instructions in director:
                 try:
                     self.game.execute(cmd)
                 except exceptions.GameOver:
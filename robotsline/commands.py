@@ -12,6 +12,9 @@ class MoveRobot:
     robot_id: int
     destination: str
 
+    def __str__(self) -> str:
+        return f"Move robot {self.robot_id} to {self.destination}"
+
 
 @dataclasses.dataclass(frozen=True)
 class Mine:
@@ -20,6 +23,9 @@ class Mine:
     robot_id: int
     material: str
 
+    def __str__(self) -> str:
+        return f"Robot {self.robot_id} mines {self.material}"
+
     @classmethod
     def Foo(cls, robot_id: int) -> "Mine":
         """Binded factory to mine foo"""
@@ -37,6 +43,9 @@ class Assemble:
 
     robot_id: int
 
+    def __str__(self) -> str:
+        return f"Robot {self.robot_id} assembles a foobar"
+
 
 @dataclasses.dataclass(frozen=True)
 class Wait:
@@ -44,6 +53,9 @@ class Wait:
 
     seconds: int
 
+    def __str__(self) -> str:
+        return f"Wait {self.seconds}s"
+
 
 @dataclasses.dataclass(frozen=True)
 class SellFoobars:
@@ -51,9 +63,15 @@ class SellFoobars:
 
     robot_id: int
 
+    def __str__(self) -> str:
+        return f"Robot {self.robot_id} sells foobars"
+
 
 @dataclasses.dataclass(frozen=True)
 class BuyRobot:
     """Get a new buddy 🤖"""
 
     robot_id: int
+
+    def __str__(self) -> str:
+        return f"Robot {self.robot_id} buys a new robot"
@@ -1,97 +1,146 @@
 """Domain models for a robotic factory"""
-import abc
+import collections
 import dataclasses
 import enum
+import heapq
 import logging
 import random
-import uuid
 from decimal import Decimal
-from itertools import count
-from typing import Iterable, Iterator, Literal, NewType, Optional
+from itertools import chain, count
+from typing import Callable, ClassVar, Iterable, Iterator, Literal, NewType, Optional
 
 from . import exceptions
-from .settings import Settings
+from .settings import DEFAULT_SETTINGS, Settings
 
 logger = logging.getLogger(__name__)
 
 Seconds = NewType("Seconds", int)
+# Built once, the tick path must not call Seconds on each round
+_ONE_SECOND = Seconds(1)
+RandInt = Callable[[int, int], int]
 
 
-class Location(enum.Enum):
-    """Where robots can go"""
+class Location(enum.IntEnum):
+    """Where robots can go
 
-    CAFETERIA = "cafeteria"
-    ON_MY_WAY = "on my way"
-    FOO_MINE = "foo mine"
-    BAR_MINE = "bar mine"
-    ASSEMBLY_LINE = "assembly line"
-    MATERIAL_STORE = "material store"
-    ROBOTS_STORE = "robots store"
+    Locations are small ints, cheap to hash, and carry a label for humans
+    """
+
+    label: str
+
+    CAFETERIA = 0, "cafeteria"
+    ON_MY_WAY = 1, "on my way"
+    FOO_MINE = 2, "foo mine"
+    BAR_MINE = 3, "bar mine"
+    ASSEMBLY_LINE = 4, "assembly line"
+    MATERIAL_STORE = 5, "material store"
+    ROBOTS_STORE = 6, "robots store"
+
+    def __new__(cls, value: int, label: str) -> "Location":
+        location = int.__new__(cls, value)
+        location._value_ = value
+        location.label = label
+        return location
 
     @classmethod
     def by_name(cls, name: str) -> "Location":
-        """Get location by name or raise UnknownLocation"""
-        try:
-            return cls(name)
-        except ValueError as bad_location:
-            raise exceptions.UnknownLocation(
-                f"Unknown location {name} 🏝"
-            ) from bad_location
+        """Get location by name, whatever its case, or raise UnknownLocation"""
+        location = _LOCATIONS_BY_NAME.get(name)
+        if location is None:
+            # any other casing still resolves
+            location = _LOCATIONS_BY_NAME.get(name.lower())
+        if location is None:
+            raise exceptions.UnknownLocation(f"Unknown location {name} 🏝")
+        return location
+
 
+# Labels as the IA sends them and as humans title them, e.g. "Foo Mine"
+_LOCATIONS_BY_NAME: dict[str, Location] = {
+    name: location
+    for location in Location
+    for name in (location.label, location.label.title())
+}
 
-class Material(abc.ABC):
+
+class Material:
     """A foe or a bar"""
 
+    __slots__ = ()
+
     name: str
     where_to_find_it: Location
     mining_time: Seconds
 
-    def __init__(self) -> None:
-        self.id_ = uuid.uuid4()
-
     @classmethod
     def from_name(
-        cls, material_name, mining_bar_range_time: tuple[int, int]
+        cls,
+        material_name,
+        mining_bar_range_time: tuple[int, int],
+        randint: RandInt = random.randint,
     ) -> "Material":
         """New material from name"""
-        if material_name.lower() == "foo":
-            return Foo()
-        if material_name.lower() == "bar":
-            return Bar.from_randomness(*mining_bar_range_time)
-        raise exceptions.UnknownMaterial(f"{material_name} is not a valid material")
+        try:
+            builder = _MATERIALS_BUILDERS[material_name.lower()]
+        except KeyError as bad_material:
+            raise exceptions.UnknownMaterial(
+                f"{material_name} is not a valid material"
+            ) from bad_material
+        return builder(mining_bar_range_time, randint)
 
 
 class Foo(Material):
+    __slots__ = ()
     name: str = "foo"
     where_to_find_it: Location = Location.FOO_MINE
     mining_time = Seconds(1)
 
 
 class Bar(Material):
+    __slots__ = ("mining_time",)
     name: str = "bar"
     where_to_find_it: Location = Location.BAR_MINE
 
     def __init__(self, mining_time: Seconds):
-        super().__init__()
         self.mining_time = mining_time
 
     @classmethod
-    def from_randomness(cls, mining_time_min: int, mining_time_max: int) -> "Bar":
-        mining_time = Seconds(random.randint(mining_time_min, mining_time_max))
-        return cls(mining_time)
-
-
-@dataclasses.dataclass(frozen=True)
+    def from_randomness(
+        cls,
+        mining_time_min: int,
+        mining_time_max: int,
+        randint: RandInt = random.randint,
+    ) -> "Bar":
+        """A bar is only its mining time, so bars are shared per mining time"""
+        mining_time = Seconds(randint(mining_time_min, mining_time_max))
+        bar = _BARS.get(mining_time)
+        if bar is None:
+            bar = _BARS[mining_time] = cls(mining_time)
+        return bar
+
+
+# Materials have no identity, mining always hands out the same instances
+_FOO = Foo()
+_BARS: dict[Seconds, Bar] = {}
+
+_MATERIALS_BUILDERS: dict[str, Callable[[tuple[int, int], RandInt], Material]] = {
+    "foo": lambda mining_bar_range_time, randint: _FOO,
+    "bar": lambda mining_bar_range_time, randint: Bar.from_randomness(
+        *mining_bar_range_time, randint
+    ),
+}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Foobar:
     """The final product"""
 
-    foo: Foo
-    bar: Bar
-    price: Decimal = Decimal("1.00")
+    PRICE_CENTS: ClassVar[int] = 100
 
 
 RobotId = int | Literal["Ghost"]
 RobotIdGenerator = Iterator[RobotId]
+StateChangeCallback = Callable[["Robot", "RobotState"], None]
+SuccessRoll = Callable[[], bool]
 
 
 class Robot:
@@ -99,9 +148,45 @@ class Robot:
     Beware a ghost may be haunting the factory
     """
 
+    __slots__ = ("id_", "_on_state_change", "_idle_states", "_state")
+
     def __init__(self, id_: RobotId, location: Location = Location.CAFETERIA):
         self.id_ = id_
-        self.state: RobotState = Idle(self, location)
+        self._on_state_change: Optional[StateChangeCallback] = None
+        # Idle states only hold a location, a robot reuses one per location
+        self._idle_states: dict[Location, Idle] = {}
+        self._state: RobotState = self._idle_at(location)
+
+    @property
+    def state(self) -> "RobotState":
+        """Current state of the robot"""
+        return self._state
+
+    @state.setter
+    def state(self, new_state: "RobotState") -> None:
+        old_state, self._state = self._state, new_state
+        if self._on_state_change is not None:
+            self._on_state_change(self, old_state)
+
+    def _idle_at(self, location: Location) -> "Idle":
+        try:
+            return self._idle_states[location]
+        except KeyError:
+            idle = self._idle_states[location] = Idle(self, location)
+            return idle
+
+    def set_idle(self, location: Location) -> None:
+        """Put the robot at rest at the given location"""
+        self.state = self._idle_at(location)
+
+    def watch(self, callback: StateChangeCallback) -> None:
+        """Be notified with the previous state each time the robot changes state
+
+        A robot has a single watcher, it cannot be watched by another one.
+        """
+        if self._on_state_change is not None and self._on_state_change != callback:
+            raise ValueError(f"{self} is already watched")
+        self._on_state_change = callback
 
     def run_round(self) -> None:
         self.state.run_round()
@@ -114,10 +199,15 @@ class Robot:
         """Return robot state as string"""
         return str(self.state)
 
+    @property
+    def is_idle(self) -> bool:
+        """Check the robot is waiting for orders, without formatting its status"""
+        return type(self._state) is Idle
+
     @property
     def location(self) -> str:
         """Return robot Location as string"""
-        return self.state.location.value
+        return self.state.location.label
 
     @classmethod
     def from_id_generator(cls, id_generator: RobotIdGenerator) -> "Robot":
@@ -126,13 +216,11 @@ class Robot:
 
     @classmethod
     def ghost(cls) -> "Robot":
-        """Build a nullable robot 👻"""
-        robot = cls(id_="Ghost")
-        robot.state = Haunting(robot)
-        return robot
+        """The nullable robot 👻"""
+        return _GHOST
 
     def __bool__(self) -> bool:
-        return self.id_ != "Ghost"
+        return self is not _GHOST
 
 
 def robots_generator() -> Iterator[Robot]:
@@ -142,42 +230,114 @@ def robots_generator() -> Iterator[Robot]:
         yield Robot.from_id_generator(counter)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Stock:
-    """Material stock"""
+    """Material stock
+
+    Robots must be given to the constructor or added with `add_robot`: the
+    `robots` list is indexed, appending to it directly leaves them unknown.
+    """
 
     robots: list[Robot] = dataclasses.field(default_factory=list)
-    foos: list[Foo] = dataclasses.field(default_factory=list)
-    bars: list[Bar] = dataclasses.field(default_factory=list)
-    foobars: list[Foobar] = dataclasses.field(default_factory=list)
-    money: Decimal = Decimal("0.00")
+    # Materials carry no data of their own, counting them is enough
+    foos: int = 0
+    bars: int = 0
+    foobars: collections.deque[Foobar] = dataclasses.field(
+        default_factory=collections.deque
+    )
+    money_cents: int = 0
     _robot_generator: Iterable[Robot] = dataclasses.field(
         default_factory=robots_generator
     )
+    _by_id: dict[RobotId, Robot] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    # Views on `robots`, kept up to date on each robot state change
+    _by_location: dict[Location, list[Robot]] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    _idle_by_location: dict[Location, list[Robot]] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+    # Robots with a task running, in the order they started it
+    _busy: dict[Robot, None] = dataclasses.field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        # Foobars are sold first in, first out
+        self.foobars = collections.deque(self.foobars)
+        for robot in self.robots:
+            self._track(robot)
+
+    def _track(self, robot: Robot) -> None:
+        if self._by_id.get(robot.id_) is robot:
+            raise ValueError(f"{robot} is already in stock")
+        self._by_id.setdefault(robot.id_, robot)
+        robot.watch(self._reindex)
+        self._index(robot, robot.state)
+
+    def _index(self, robot: Robot, state: "RobotState") -> None:
+        self._by_location.setdefault(state.location, []).append(robot)
+        if isinstance(state, Idle):
+            self._idle_by_location.setdefault(state.location, []).append(robot)
+        else:
+            self._busy[robot] = None
+
+    def _unindex(self, robot: Robot, state: "RobotState") -> None:
+        self._by_location[state.location].remove(robot)
+        if isinstance(state, Idle):
+            self._idle_by_location[state.location].remove(robot)
+        else:
+            del self._busy[robot]
+
+    def _reindex(self, robot: Robot, old_state: "RobotState") -> None:
+        self._unindex(robot, old_state)
+        self._index(robot, robot.state)
 
     def add_robot(self) -> None:
         """Add a free robot to the factory"""
-        self.robots.append(next(self._robot_generator))
+        robot = next(self._robot_generator)
+        self.robots.append(robot)
+        self._track(robot)
+
+    def robots_at(self, location: Location) -> list[Robot]:
+        """Robots currently at the given location"""
+        return self._by_location.get(location, [])
+
+    def idle_robots_at(self, location: Location) -> list[Robot]:
+        """Idle robots currently at the given location"""
+        return self._idle_by_location.get(location, [])
 
     def idle_robots(self) -> Iterable[Robot]:
-        return (robot for robot in self.robots if robot.status == "idle")
+        """All idle robots, wherever they are"""
+        return chain.from_iterable(self._idle_by_location.values())
+
+    def busy_robots(self) -> list[Robot]:
+        """Snapshot of the robots with a task running"""
+        return list(self._busy)
+
+    @property
+    def money(self) -> Decimal:
+        """Money in the moneybag 💰"""
+        return Decimal(self.money_cents).scaleb(-2)
 
     def has_enough_material(self) -> bool:
         """Check if wa have enough material to build a foobar"""
-        if len(self.foos) < 1:
-            logger.info("Not enough foos in stock!")
-            return False
-        if len(self.bars) < 1:
-            logger.error("Not enough bars in stock!")
-            return False
-        return True
+        return self.foos >= 1 and self.bars >= 1
 
     def start_assembling(self) -> Foobar:
         """Begin to assemble a new foobar"""
         if not self.has_enough_material():
+            # only a refused assembly is worth a log, not every check
+            if self.foos < 1:
+                logger.info("Not enough foos in stock!")
+            else:
+                logger.error("Not enough bars in stock!")
             raise exceptions.NotEnoughMaterial("Not enough material!")
-        foo, bar = self.foos.pop(), self.bars.pop()
-        return Foobar(foo, bar)
+        self.foos -= 1
+        self.bars -= 1
+        return Foobar()
 
     def end_assembling_success(self, foobar: Foobar):
         """A new Foobar is built 😂"""
@@ -186,86 +346,89 @@ class Stock:
     def end_assembling_failure(self, foobar: Foobar):
         """Oh no!! 😥"""
         # we still saved a bar...
-        self.bars.append(foobar.bar)
+        self.bars += 1
 
     def new_material(self, material: Material):
         """Add a new material in stock"""
-        match material:
-            case Foo():
-                self.foos.append(material)
-            case Bar():
-                self.bars.append(material)
+        name = material.name
+        if name == Foo.name:
+            self.foos += 1
+        elif name == Bar.name:
+            self.bars += 1
 
     def start_selling(self, min_nb: int, max_nb: int) -> list[Foobar]:
         """Get foobars to sell"""
         sell_nb = min((max_nb, len(self.foobars)))
         if sell_nb < min_nb:
             raise exceptions.NotEnoughMaterial("Not enough foobars")
-        to_sell, self.foobars = self.foobars[:sell_nb], self.foobars[sell_nb:]
-        return to_sell
+        return [self.foobars.popleft() for _ in range(sell_nb)]
 
     def sold(self, foobars: list[Foobar]):
         logger.info("%s Foobar(s) sold", len(foobars))
-        self.money += sum(foobar.price for foobar in foobars)
+        self.money_cents += Foobar.PRICE_CENTS * len(foobars)
 
-    def can_buy_robot(self, required_money: Decimal | int, required_foos: int) -> bool:
-        return required_money <= self.money and required_foos <= len(self.foos)
+    def can_buy_robot(self, required_money_cents: int, required_foos: int) -> bool:
+        enough_money = required_money_cents <= self.money_cents
+        return enough_money and required_foos <= self.foos
 
-    def buy_robot(self, required_money: Decimal, required_foos: int):
+    def buy_robot(self, required_money_cents: int, required_foos: int):
         """Buy a robot"""
-        if not self.can_buy_robot(required_money, required_foos):
+        if not self.can_buy_robot(required_money_cents, required_foos):
             raise exceptions.NotEnoughMaterial("Not enough money or foos")
 
-        self.money -= required_money
-        for _ in range(required_foos):
-            self.foos.pop()
+        self.money_cents -= required_money_cents
+        self.foos -= required_foos
 
         self.add_robot()
 
     def get_robot(self, robot_id: int) -> Robot:
         """Get the robot with the given id"""
-        for robot in self.robots:
-            if robot.id_ == robot_id:
-                return robot
-        logger.error("Robot %s not found", robot_id)
-        return Robot.ghost()
+        robot = self._by_id.get(robot_id)
+        if robot is None:
+            logger.error("Robot %s not found", robot_id)
+            return Robot.ghost()
+        return robot
 
 
-class RobotState(abc.ABC):
+class RobotState:
     """Abstract robot state"""
 
+    __slots__ = ("robot", "countdown", "location")
+
     def __init__(self, robot: "Robot", countdown: Seconds, location: Location) -> None:
         self.robot = robot
         self.countdown = countdown
         self.location = location
 
     def __str__(self) -> str:
-        return self.__class__.__name__
+        return type(self).__name__
 
     def idle(self, location: Location) -> None:
         """Set robot to idle state"""
-        self.robot.state = Idle(self.robot, location)
+        self.robot.set_idle(location)
+
+    # Only an idle robot accepts orders, Idle overrides these refusals
 
     def move(self, destination: Location) -> None:
-        """Try to move the robot"""
+        """Refuse to move the robot"""
         raise exceptions.InvalidTransition(f"Cannot move robot {self.robot}")
 
     def mine(self, material: Material, stock: Stock) -> None:
-        """Try to send the robot to mine"""
+        """Refuse to send the robot to mine"""
         raise exceptions.InvalidTransition(f"Cannot send robot {self.robot} to mine.")
 
-    def assemble(self, stock: Stock, assembly_success_rate: float) -> None:
-        """Try to send the robot to assembly line"""
+    def assemble(self, stock: Stock, succeeds: SuccessRoll) -> None:
+        """Refuse to send the robot to assembly line"""
         raise exceptions.InvalidTransition(
             f"Cannot send robot {self.robot} to assembly line."
         )
 
     def sell(self, stock: Stock, min_nb: int, max_nb: int) -> None:
-        """Try to tell the robot to sell some foobars"""
+        """Refuse to tell the robot to sell some foobars"""
         raise exceptions.InvalidTransition("Cannot sell foobar")
 
-    def buy(self, stock: Stock, required_money: Decimal, required_foos: int) -> None:
-        """Try to buy a robot"""
+    def buy(self, stock: Stock, required_money_cents: int, required_foos: int) -> None:
+        """Refuse to buy a robot"""
         raise exceptions.InvalidTransition("Cannot buy robot")
 
     def haunt(self):
@@ -276,17 +439,27 @@ class RobotState(abc.ABC):
 
     def terminate(self) -> None:
         """Task is done"""
+        task_end = _TASK_ENDS.get(type(self))
+        if task_end is not None:
+            task_end(self)
 
     def run_round(self) -> None:
         """A second of time..."""
-        self.countdown -= Seconds(1)
-        if self.countdown == Seconds(0):
+        self.elapse(_ONE_SECOND)
+
+    def elapse(self, seconds: Seconds) -> None:
+        """Some seconds of time, the task cannot end before the last one"""
+        countdown = self.countdown - seconds
+        self.countdown = countdown
+        if not countdown:
             self.terminate()
 
 
 class Haunting(RobotState):
     """👻"""
 
+    __slots__ = ()
+
     def __init__(self, robot: "Robot"):
         location = Location.ON_MY_WAY
         countdown = Seconds(999_999_999)
@@ -296,19 +469,23 @@ class Haunting(RobotState):
 class Moving(RobotState):
     """Robot is 🚶"""
 
+    __slots__ = ("destination",)
+
     DURATION: Seconds = Seconds(5)
 
     def __init__(self, robot: "Robot", destination: Location):
         super().__init__(robot, self.DURATION, Location.ON_MY_WAY)
         self.destination = destination
 
-    def terminate(self) -> None:
-        self.robot.state = Idle(self.robot, location=self.destination)
+
+_MINING_STATUSES = {name: f"Mining {name}" for name in _MATERIALS_BUILDERS}
 
 
 class Mining(RobotState):
     """Robot is ⛏"""
 
+    __slots__ = ("material", "stock")
+
     def __init__(self, robot: "Robot", material: Material, stock: Stock) -> None:
         super().__init__(
             robot,
@@ -319,40 +496,33 @@ class Mining(RobotState):
         self.stock = stock
 
     def __str__(self) -> str:
-        return f"Mining {self.material.name}"
-
-    def terminate(self) -> None:
-        self.stock.new_material(self.material)
-        self.robot.state = Idle(self.robot, self.location)
+        return _MINING_STATUSES[self.material.name]
 
 
 class Assembling(RobotState):
     """Robot is assembling"""
 
+    __slots__ = ("stock", "foobar", "succeeds")
+
     LOCATION = Location.ASSEMBLY_LINE
 
     def __init__(
-        self, robot: "Robot", foobar: Foobar, stock: Stock, assembly_success_rate: float
+        self, robot: "Robot", foobar: Foobar, stock: Stock, succeeds: SuccessRoll
     ) -> None:
         super().__init__(robot, countdown=Seconds(2), location=self.LOCATION)
         self.stock = stock
         self.foobar = foobar
-        self.assembly_success_rate = assembly_success_rate
+        self.succeeds = succeeds
 
     def __str__(self) -> str:
         return "Assembling a foobar..."
 
-    def terminate(self) -> None:
-        if random.random() <= self.assembly_success_rate:
-            self.stock.end_assembling_success(self.foobar)
-        else:
-            self.stock.end_assembling_failure(self.foobar)
-        self.robot.state = Idle(self.robot, location=self.location)
-
 
 class Sell(RobotState):
     """Robot is selling"""
 
+    __slots__ = ("stock", "foobars")
+
     LOCATION = Location.MATERIAL_STORE
 
     def __init__(self, robot: "Robot", stock: Stock, foobars: list[Foobar]) -> None:
@@ -363,31 +533,33 @@ class Sell(RobotState):
     def __str__(self) -> str:
         return f"Selling {len(self.foobars)} foobar(s)..."
 
-    def terminate(self) -> None:
-        self.stock.sold(self.foobars)
-        self.robot.state = Idle(self.robot, location=self.location)
-
 
 class Idle(RobotState):
     """Robot is sleeping 😴"""
 
+    __slots__ = ()
+
     def __init__(self, robot: "Robot", location: Location) -> None:
         super().__init__(robot, countdown=Seconds(0), location=location)
 
-    def move(self, destination: Location):
+    def elapse(self, seconds: Seconds) -> None:
+        """Nothing to count down, and the state may be reused later"""
+
+    def move(self, destination: Location) -> None:
         self.robot.state = Moving(self.robot, destination)
 
-    def mine(self, material: Material, stock: Stock):
-        if self.location is material.where_to_find_it:
-            self.robot.state = Mining(self.robot, material, stock)
-        raise exceptions.InvalidTransition(
-            f"Move to {material.where_to_find_it.value} before mining {material.name}"
-        )
+    def mine(self, material: Material, stock: Stock) -> None:
+        if self.location is not material.where_to_find_it:
+            mine = material.where_to_find_it.label
+            raise exceptions.InvalidTransition(
+                f"Move to {mine} before mining {material.name}"
+            )
+        self.robot.state = Mining(self.robot, material, stock)
 
-    def assemble(self, stock: Stock, assembly_success_rate: float):
-        if not self.location is Assembling.LOCATION:
+    def assemble(self, stock: Stock, succeeds: SuccessRoll) -> None:
+        if self.location is not Assembling.LOCATION:
             raise exceptions.InvalidTransition(
-                f"Move to {Assembling.LOCATION.value} first"
+                f"Move to {Assembling.LOCATION.label} first"
             )
         try:
             foobar = stock.start_assembling()
@@ -398,51 +570,121 @@ class Idle(RobotState):
             self.robot,
             foobar=foobar,
             stock=stock,
-            assembly_success_rate=assembly_success_rate,
+            succeeds=succeeds,
         )
 
     def sell(self, stock: Stock, min_nb: int, max_nb: int) -> None:
         """Try to sell between min and max foobar"""
-        if not self.location is Sell.LOCATION:
-            raise exceptions.InvalidTransition(f"Move to {Sell.LOCATION.value} first")
+        if self.location is not Sell.LOCATION:
+            raise exceptions.InvalidTransition(f"Move to {Sell.LOCATION.label} first")
         foobars = stock.start_selling(min_nb, max_nb)
         self.robot.state = Sell(self.robot, stock=stock, foobars=foobars)
 
-    def buy(self, stock: Stock, required_money: Decimal, required_foos: int) -> None:
-        if not self.location is Location.ROBOTS_STORE:
+    def buy(self, stock: Stock, required_money_cents: int, required_foos: int) -> None:
+        if self.location is not Location.ROBOTS_STORE:
             raise exceptions.InvalidTransition(
-                f"Move to {Location.ROBOTS_STORE.value} first"
+                f"Move to {Location.ROBOTS_STORE.label} first"
             )
-        stock.buy_robot(required_money, required_foos)
+        stock.buy_robot(required_money_cents, required_foos)
+
+
+def _moving_end(state: Moving) -> None:
+    state.robot.set_idle(state.destination)
+
+
+def _mining_end(state: Mining) -> None:
+    state.stock.new_material(state.material)
+    state.robot.set_idle(state.location)
+
+
+def _assembling_end(state: Assembling) -> None:
+    if state.succeeds():
+        state.stock.end_assembling_success(state.foobar)
+    else:
+        state.stock.end_assembling_failure(state.foobar)
+    state.robot.set_idle(state.location)
+
+
+def _selling_end(state: Sell) -> None:
+    state.stock.sold(state.foobars)
+    state.robot.set_idle(state.location)
+
+
+# What happens when a task is over, states missing here just stop
+_TASK_ENDS: dict[type[RobotState], Callable[..., None]] = {
+    Moving: _moving_end,
+    Mining: _mining_end,
+    Assembling: _assembling_end,
+    Sell: _selling_end,
+}
+
+
+def _summon_ghost() -> Robot:
+    ghost = Robot(id_="Ghost")
+    ghost.state = Haunting(ghost)
+    return ghost
+
+
+# The one and only ghost, shared by every lookup miss
+_GHOST = _summon_ghost()
+
+
+_ROLLS_BATCH_SIZE = 1024
 
 
 class RoboticFactory:
     """Outstanding Robotic factory 🏭"""
 
+    __slots__ = ("stock", "seconds_left", "settings", "_rng", "_rolls")
+
     def __init__(
         self,
         stock: Optional[Stock] = None,
-        settings: Settings = Settings(),
+        settings: Optional[Settings] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
 
         if stock is None:
             stock = Stock([])
+        if settings is None:
+            settings = DEFAULT_SETTINGS
 
         self.stock: Stock = stock
         self.seconds_left = Seconds(0)
         self.settings = settings
+        if rng is None:
+            # seeded once from the module, so that random.seed() replays a game
+            # and batched rolls do not shift what others draw from the module
+            rng = random.Random(random.getrandbits(64))
+        self._rng = rng
+        self._rolls: list[bool] = []
+
+    def roll_assembly_success(self) -> bool:
+        """Throw the dice for an assembly 🎲
+
+        Dice are thrown by batches, each assembly takes the next result
+        """
+        if not self._rolls:
+            rate, rand = self.settings.assembly_success_rate, self._rng.random
+            rolls = [rand() <= rate for _ in range(_ROLLS_BATCH_SIZE)]
+            # popped from the end, so reversed to hand them out in draw order
+            rolls.reverse()
+            self._rolls = rolls
+        return self._rolls.pop()
 
     @classmethod
-    def from_settings(cls, settings: Settings) -> "RoboticFactory":
+    def from_settings(
+        cls, settings: Settings, rng: Optional[random.Random] = None
+    ) -> "RoboticFactory":
         """Build a factory from the settings"""
         stock = Stock()
         for _ in range(settings.initial_robots_nb):
             stock.add_robot()
-        return cls(stock, settings)
+        return cls(stock, settings, rng)
 
     def move(self, robot_id: int, destination: str) -> None:
         """Say robot to move"""
-        true_destination = Location.by_name(destination.lower())
+        true_destination = Location.by_name(destination)
         robot = self.stock.get_robot(robot_id)
         robot.state.move(true_destination)
 
@@ -450,14 +692,14 @@ class RoboticFactory:
         """Say robot to move"""
         robot = self.stock.get_robot(robot_id)
         true_material = Material.from_name(
-            material, self.settings.mining_bar_range_time
+            material, self.settings.mining_bar_range_time, self._rng.randint
         )
         robot.state.mine(true_material, self.stock)
 
     def assemble(self, robot_id: int) -> None:
         """Say robot to assemble foobar"""
         robot = self.stock.get_robot(robot_id)
-        robot.state.assemble(self.stock, self.settings.assembly_success_rate)
+        robot.state.assemble(self.stock, self.roll_assembly_success)
 
     def sell(self, robot_id: int) -> None:
         """Say robot to sell foobars"""
@@ -468,18 +710,47 @@ class RoboticFactory:
     def buy_robot(self, robot_id: int) -> None:
         """Say robot to buy a new buddy"""
         robot = self.stock.get_robot(robot_id)
-        required_money, required_foos = self.settings.robot_cost
-        robot.state.buy(self.stock, Decimal(required_money), required_foos)
+        settings = self.settings
+        robot.state.buy(self.stock, settings.robot_cost_cents, settings.robot_cost_foos)
 
-    def run_round(self) -> None:
-        """Run a given round"""
+    def _check_game_over(self) -> None:
         if len(self.stock.robots) >= self.settings.limit_of_robots_for_game_over:
             raise exceptions.GameOver
-        for robot in self.stock.robots:
-            robot.run_round()
-        self.seconds_left += Seconds(1)
+
+    def _elapse(self, seconds: Seconds) -> None:
+        """Let some seconds pass, no task may end strictly before the last one"""
+        # Only busy robots have a task to count down
+        for robot in self.stock.busy_robots():
+            robot.state.elapse(seconds)
+        self.seconds_left += seconds
+
+    def run_round(self) -> None:
+        """Run a given round"""
+        self._check_game_over()
+        self._elapse(_ONE_SECOND)
 
     def wait(self, seconds: int) -> None:
-        """Simulate some seconds in the factory"""
-        for _ in range(seconds):
-            self.run_round()
+        """Simulate some seconds in the factory
+
+        Nothing happens between two task ends, so time jumps from one to the next.
+        Waiting never starts a task, the busy robots are known upfront.
+        """
+        if seconds <= 0:
+            return
+        self._check_game_over()
+        # Task ends ordered by time, then by task start
+        agenda = []
+        for rank, robot in enumerate(self.stock.busy_robots()):
+            state = robot.state
+            if state.countdown > 0:
+                agenda.append((state.countdown, rank, state))
+            else:
+                # round by round, a task already at zero never ends either
+                state.elapse(Seconds(seconds))
+        heapq.heapify(agenda)
+        while agenda and agenda[0][0] <= seconds:
+            task_end, _, state = heapq.heappop(agenda)
+            state.elapse(task_end)
+        for _, _, state in agenda:
+            state.elapse(Seconds(seconds))
+        self.seconds_left += seconds
@@ -3,13 +3,27 @@ import dataclasses
 from decimal import Decimal
 
 
-@dataclasses.dataclass
+def to_cents(amount: Decimal | int) -> int:
+    """Convert an amount of money into integer cents"""
+    return int(amount * 100)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Settings:
-    """Bundle of settings"""
+    """Bundle of settings, safe to share between games"""
 
     initial_robots_nb: int = 2
     assembly_success_rate: float = 0.6
     mining_bar_range_time: tuple[int, int] = (1, 2)
     foobars_selling_range: tuple[int, int] = (1, 5)
-    robot_cost: tuple[int, int] = (3, 6)  # (money; foos)
+    robot_cost_money: int = 3
+    robot_cost_foos: int = 6
     limit_of_robots_for_game_over: int = 30
+    robot_cost_cents: int = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # frozen, so the derived field is set around __setattr__
+        object.__setattr__(self, "robot_cost_cents", to_cents(self.robot_cost_money))
+
+
+DEFAULT_SETTINGS = Settings()
@@ -5,23 +5,41 @@ from typing import Callable, Optional
 
 import pytest
 
-from robotsline.models import Bar, Foo, Foobar, Robot, Stock
-from robotsline.settings import Settings
+from robotsline.models import Foobar, Location, Robot, RoboticFactory, Stock
+from robotsline.settings import Settings, to_cents
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def stock_factory() -> Callable[[...], Stock]:
     def _factory(
         robots: list[Robot],
         foos_nb: int = 0,
         bars_nb: int = 0,
-        money: Decimal = Decimal("0.00"),
+        money: Decimal | int = 0,
         foobars: Optional[list[Foobar]] = None,
     ):
         if foobars is None:
             foobars = []
-        foos = [Foo() for _ in range(foos_nb)]
-        bars = [Bar(1) for _ in range(bars_nb)]
-        return Stock(robots=robots, foos=foos, bars=bars, money=money, foobars=foobars)
+        return Stock(
+            robots=robots,
+            foos=foos_nb,
+            bars=bars_nb,
+            money_cents=to_cents(money),
+            foobars=foobars,
+        )
+
+    return _factory
+
+
+@pytest.fixture(scope="session")
+def make_factory() -> Callable[..., tuple[Robot, Stock, RoboticFactory]]:
+    """A factory with a single robot, the usual test setup"""
+
+    def _factory(
+        location: Location = Location.CAFETERIA, settings: Optional[Settings] = None
+    ):
+        robot = Robot(1, location=location)
+        stock = Stock([robot])
+        return robot, stock, RoboticFactory(stock, settings)
 
     return _factory
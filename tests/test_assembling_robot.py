@@ -1,10 +1,12 @@
 """Test the assembling"""
 # pylint: disable=missing-docstring
-
+import random
 
 from robotsline import commands, handlers, models
 from robotsline.settings import Settings
 
+WAIT_2S = commands.Wait(seconds=2)
+
 
 def test_asking_a_robot_to_assemble_foo_and_bar(stock_factory):
     # Given a factory with enough stock
@@ -20,8 +22,8 @@ def test_asking_a_robot_to_assemble_foo_and_bar(stock_factory):
     # the robot is assembling
     assert robot.status == "Assembling a foobar..."
     # and stock is lower
-    assert len(factory.stock.foos) == 0
-    assert len(factory.stock.bars) == 0
+    assert factory.stock.foos == 0
+    assert factory.stock.bars == 0
 
 
 def test_asking_a_robot_to_assemble_but_she_is_busy(stock_factory):
@@ -38,10 +40,10 @@ def test_asking_a_robot_to_assemble_but_she_is_busy(stock_factory):
     # Then the robot is still moving
     assert robot.status == "Moving"
     # And stock didn't changed
-    assert len(factory.stock.foos) == 1
-    assert len(factory.stock.bars) == 1
+    assert factory.stock.foos == 1
+    assert factory.stock.bars == 1
     # And foobar is not yet produced
-    assert factory.stock.foobars == []
+    assert not factory.stock.foobars
 
 
 def test_it_always_takes_2_seconds_to_assemble_a_foobar(stock_factory):
@@ -57,14 +59,14 @@ def test_it_always_takes_2_seconds_to_assemble_a_foobar(stock_factory):
     # And I wait 2 seconds
     assemble = commands.Assemble(robot_id=robot.id_)
     handlers.execute(assemble, on_factory=factory)
-    handlers.execute(commands.Wait(2), on_factory=factory)
+    handlers.execute(WAIT_2S, on_factory=factory)
 
     # the robot is idling at the assembly line
     assert robot.status == "Idle"
     assert robot.state.location == models.Location.ASSEMBLY_LINE
     # and stock is lower
-    assert len(factory.stock.foos) == 0
-    assert len(factory.stock.bars) == 0
+    assert factory.stock.foos == 0
+    assert factory.stock.bars == 0
     # but a foobar has been created
     assert len(stock.foobars) == 1
 
@@ -82,13 +84,67 @@ def test_assembling_a_foobar_may_fail(stock_factory):
     # And I wait 2 seconds
     assemble = commands.Assemble(robot_id=robot.id_)
     handlers.execute(assemble, on_factory=factory)
-    handlers.execute(commands.Wait(2), on_factory=factory)
+    handlers.execute(WAIT_2S, on_factory=factory)
 
     # the robot is idling at the assembly line
     assert robot.status == "Idle"
     assert robot.state.location == models.Location.ASSEMBLY_LINE
     # and stock of foos is lower but the bar can be reused
-    assert len(factory.stock.foos) == 0
-    assert len(factory.stock.bars) == 1
+    assert factory.stock.foos == 0
+    assert factory.stock.bars == 1
     # And foobar has not been created
     assert len(stock.foobars) == 0
+
+
+def _play_a_game(stock_factory, rng=None) -> list[tuple[int, int]]:
+    """Mine bars and assemble them, the mining times and foobars tell the game"""
+    miner = models.Robot(id_=1, location=models.Location.BAR_MINE)
+    assembler = models.Robot(id_=2, location=models.Location.ASSEMBLY_LINE)
+    stock = stock_factory(foos_nb=20, robots=[miner, assembler])
+    factory = models.RoboticFactory(stock=stock, rng=rng)
+    game = []
+    for _ in range(20):
+        factory.mine(miner.id_, material="bar")
+        mining_time = miner.state.countdown
+        handlers.execute(commands.Wait(seconds=mining_time), on_factory=factory)
+        factory.assemble(assembler.id_)
+        handlers.execute(WAIT_2S, on_factory=factory)
+        game.append((mining_time, len(stock.foobars)))
+    return game
+
+
+def test_a_game_can_be_replayed_with_the_same_seed(stock_factory):
+    # Given a game played after seeding the random module
+    random.seed(7)
+    first_game = _play_a_game(stock_factory)
+
+    # When I seed it again and replay the same orders
+    random.seed(7)
+
+    # Then bars take as long to mine, and the same assemblies succeed
+    assert _play_a_game(stock_factory) == first_game
+
+
+def test_a_game_can_be_replayed_with_its_own_generator(stock_factory):
+    # Given a game played with its own generator
+    random.seed(1)
+    first_game = _play_a_game(stock_factory, rng=random.Random(7))
+
+    # When I replay it with the same generator, whatever the module seed
+    random.seed(2)
+
+    # Then bars take as long to mine, and the same assemblies succeed
+    assert _play_a_game(stock_factory, rng=random.Random(7)) == first_game
+
+
+def test_batched_assembly_rolls_come_in_draw_order():
+    # Given a factory and a generator sharing the same seed
+    factory = models.RoboticFactory(rng=random.Random(3))
+    generator = random.Random(3)
+    rate = factory.settings.assembly_success_rate
+
+    # When the factory rolls for more assemblies than a batch holds
+    rolls = [factory.roll_assembly_success() for _ in range(1500)]
+
+    # Then it rolls as if each assembly had drawn its own number
+    assert rolls == [generator.random() <= rate for _ in range(1500)]
@@ -4,20 +4,23 @@ import pytest
 
 from robotsline import commands, handlers, models
 
+TEN = models.Decimal("10.00")
+
+WRONG_BUY_PLACES = tuple(
+    location
+    for location in models.Location
+    if location is not models.Location.ROBOTS_STORE
+)
+
 
 @pytest.mark.parametrize(
-    "wrong_place",
-    [
-        location
-        for location in models.Location
-        if location is not models.Location.ROBOTS_STORE
-    ],
+    "wrong_place", WRONG_BUY_PLACES, ids=[place.name for place in WRONG_BUY_PLACES]
 )
 def test_buying_at_the_wrong_place(wrong_place: models.Location, stock_factory):
     # Given a factory with some money and foos
     # And a robot not in the robot store
     robot = models.Robot(id_=1, location=wrong_place)
-    stock = stock_factory([robot], money=models.Decimal("10.00"), foos_nb=6)
+    stock = stock_factory([robot], money=TEN, foos_nb=6)
     factory = models.RoboticFactory(stock=stock)
 
     # When I ask her to buy a Robot
@@ -34,7 +37,7 @@ def test_buying_a_robot_costs_money_and_foos(stock_factory):
     # Given a factory with some money and foos
     # And a robot in the robot store
     robot = models.Robot(id_=1, location=models.Location.ROBOTS_STORE)
-    stock = stock_factory([robot], money=models.Decimal("10.00"), foos_nb=6)
+    stock = stock_factory([robot], money=TEN, foos_nb=6)
     factory = models.RoboticFactory(stock=stock)
 
     # When I ask her to buy a Robot
@@ -47,7 +50,7 @@ def test_buying_a_robot_costs_money_and_foos(stock_factory):
     assert robot.status == "Idle"
     # and we've got 6 foos and 3€ less
     assert stock.money == 7
-    assert len(stock.foos) == 0
+    assert stock.foos == 0
 
 
 @pytest.mark.parametrize(
@@ -62,7 +65,7 @@ def test_buying_a_robot_but_not_enough_resources(money: int, foos: int, stock_fa
     # Given a factory with not enough money and/or foos
     # And a robot in the robot store
     robot = models.Robot(id_=1, location=models.Location.ROBOTS_STORE)
-    stock = stock_factory([robot], money=models.Decimal(money), foos_nb=foos)
+    stock = stock_factory([robot], money=money, foos_nb=foos)
     factory = models.RoboticFactory(stock=stock)
 
     # When I ask her to buy a Robot
@@ -75,4 +78,20 @@ def test_buying_a_robot_but_not_enough_resources(money: int, foos: int, stock_fa
     assert robot.status == "Idle"
     # and stock didn't changed
     assert stock.money == money
-    assert len(stock.foos) == foos
+    assert stock.foos == foos
+
+
+def test_a_bought_robot_is_ready_to_work(stock_factory):
+    # Given a robot in the robot store with enough money and foos
+    robot = models.Robot(id_=42, location=models.Location.ROBOTS_STORE)
+    stock = stock_factory([robot], money=TEN, foos_nb=6)
+    factory = models.RoboticFactory(stock=stock)
+
+    # When I buy a new robot
+    handlers.execute(commands.BuyRobot(robot_id=robot.id_), on_factory=factory)
+    new_robot = stock.robots[-1]
+
+    # Then I can ask her to move
+    move = commands.MoveRobot(robot_id=new_robot.id_, destination="foo mine")
+    handlers.execute(move, on_factory=factory)
+    assert new_robot.status == "Moving"
@@ -6,7 +6,7 @@ from robotsline import commands, exceptions, handlers, models
 
 def test_game_is_over_when_30_robots_is_in():
     # Given I have 29 robots in a factory
-    robots = [models.Robot(robot_id) for robot_id in range(30)]
+    robots = list(map(models.Robot, range(30)))
     stock = models.Stock(robots)
     factory = models.RoboticFactory(stock)
 
@@ -5,16 +5,19 @@ import pytest
 from robotsline import commands, handlers, models
 from robotsline.settings import Settings
 
+WAIT_1S = commands.Wait(seconds=1)
+WAIT_9S = commands.Wait(seconds=9)
+
 
 @pytest.mark.parametrize(
     "material,at_mine",
     [("foo", models.Location.FOO_MINE), ("bar", models.Location.BAR_MINE)],
 )
-def test_asking_a_robot_to_mine_something(material: str, at_mine: models.Location):
+def test_asking_a_robot_to_mine_something(
+    material: str, at_mine: models.Location, make_factory
+):
     # Given a robot at the mine
-    robot = models.Robot(1, location=at_mine)
-    stock = models.Stock([robot])
-    factory = models.RoboticFactory(stock)
+    robot, _, factory = make_factory(at_mine)
 
     # When I ask her to mine
     mine = commands.Mine(robot_id=robot.id_, material=material)
@@ -24,11 +27,20 @@ def test_asking_a_robot_to_mine_something(material: str, at_mine: models.Locatio
     assert robot.status == f"Mining {material}"
 
 
-def test_asking_a_robot_to_mine_a_bad_material():
+def test_starting_to_mine_is_not_an_error():
+    # Given an idle robot at the foo mine
+    robot = models.Robot(1, location=models.Location.FOO_MINE)
+
+    # When I ask her to mine foo, she starts without complaining
+    robot.state.mine(models.Foo(), models.Stock([robot]))
+
+    # And she is mining
+    assert robot.status == "Mining foo"
+
+
+def test_asking_a_robot_to_mine_a_bad_material(make_factory):
     # Given a robot in a factory
-    robot = models.Robot(id_=1)
-    stock = models.Stock([robot])
-    factory = models.RoboticFactory(stock)
+    robot, _, factory = make_factory()
 
     # When I ask her to mine a strange material
     mine = commands.Mine(robot_id=robot.id_, material="💰")
@@ -43,12 +55,10 @@ def test_asking_a_robot_to_mine_a_bad_material():
     [("bar", models.Location.FOO_MINE), ("foo", models.Location.BAR_MINE)],
 )
 def test_asking_a_robot_to_mine_something_but_she_is_at_the_wrong_mine(
-    wrong_material: str, at_mine: models.Location
+    wrong_material: str, at_mine: models.Location, make_factory
 ):
     # Given a robot at the mine
-    robot = models.Robot(1, location=at_mine)
-    stock = models.Stock([robot])
-    factory = models.RoboticFactory(stock)
+    robot, _, factory = make_factory(at_mine)
 
     # When I ask her to mine the wrong material
     mine = commands.Mine(robot_id=robot.id_, material=wrong_material)
@@ -58,61 +68,59 @@ def test_asking_a_robot_to_mine_something_but_she_is_at_the_wrong_mine(
     assert robot.status == "Idle"
 
 
-def test_mining_foo():
-    # Given a robot at foo mine, and a factory with no foo stock
-    robot = models.Robot(1, location=models.Location.FOO_MINE)
-    stock = models.Stock([robot])
-
-    factory = models.RoboticFactory(stock)
-
-    # When I ask her to mine foo for 1 second
-    mine = commands.Mine(robot_id=1, material="foo")
-    handlers.execute(mine, on_factory=factory)
-    handlers.execute(commands.Wait(seconds=1), on_factory=factory)
-
-    # the robot is idling at the mine
-    assert robot.status == "Idle"
-    assert robot.state.location == models.Location.FOO_MINE
-    # And the stock of Foo increased
-    assert len(stock.foos) == 1
-
-
-def test_mining_bar():
-    # Given a robot at bar mine, and a factory with no bar stock
-    robot = models.Robot(1, location=models.Location.BAR_MINE)
-    stock = models.Stock([robot])
-
+@pytest.mark.parametrize(
+    "material,at_mine",
+    [("foo", models.Location.FOO_MINE), ("bar", models.Location.BAR_MINE)],
+)
+def test_mining(material: str, at_mine: models.Location, make_factory):
+    # Given a robot at the mine, and a factory with no stock of that material
+    # And mining takes a second
     settings = Settings(mining_bar_range_time=(1, 1))
-    factory = models.RoboticFactory(stock=stock, settings=settings)
+    robot, stock, factory = make_factory(at_mine, settings=settings)
 
-    # When I ask her to mine bar for 1 second
-    mine = commands.Mine(robot_id=1, material="bar")
+    # When I ask her to mine for 1 second
+    mine = commands.Mine(robot_id=1, material=material)
     handlers.execute(mine, on_factory=factory)
-    handlers.execute(commands.Wait(seconds=1), on_factory=factory)
+    handlers.execute(WAIT_1S, on_factory=factory)
 
     # the robot is idling at the mine
     assert robot.status == "Idle"
-    assert robot.state.location == models.Location.BAR_MINE
-    # And the stock of bars increased
-    assert len(stock.bars) == 1
+    assert robot.state.location == at_mine
+    # And the stock of the material increased
+    assert getattr(stock, f"{material}s") == 1
 
 
-def test_mining_bar_waiting_longer():
+def test_mining_bar_waiting_longer(make_factory):
     # Given a robot at bar mine, and a factory with no bar stock
-    robot = models.Robot(1, location=models.Location.BAR_MINE)
-    stock = models.Stock([robot])
-
     # And mining bar may take a long time
     settings = Settings(mining_bar_range_time=(10, 10))
-    factory = models.RoboticFactory(stock=stock, settings=settings)
+    robot, _, factory = make_factory(models.Location.BAR_MINE, settings=settings)
 
     # When I ask her to mine bar for 1 second
     mine = commands.Mine(robot_id=1, material="bar")
     handlers.execute(mine, on_factory=factory)
-    handlers.execute(commands.Wait(seconds=1), on_factory=factory)
+    handlers.execute(WAIT_1S, on_factory=factory)
 
     # The robot is still mining bar
     assert robot.status == "Mining bar"
     # And I need 9 seconds more to mine bar
-    handlers.execute(commands.Wait(seconds=9), on_factory=factory)
+    handlers.execute(WAIT_9S, on_factory=factory)
     assert robot.status == "Idle"
+
+
+def test_waiting_is_like_running_rounds_for_an_instant_mining(make_factory):
+    # Given two robots asked to mine bars that take no time to mine
+    settings = Settings(mining_bar_range_time=(0, 0))
+    by_rounds, _, rounds_factory = make_factory(models.Location.BAR_MINE, settings)
+    by_wait, _, wait_factory = make_factory(models.Location.BAR_MINE, settings)
+    rounds_factory.mine(robot_id=1, material="bar")
+    wait_factory.mine(robot_id=1, material="bar")
+
+    # When one factory runs 3 rounds and the other waits 3 seconds
+    for _ in range(3):
+        rounds_factory.run_round()
+    handlers.execute(commands.Wait(seconds=3), on_factory=wait_factory)
+
+    # Then both robots are in the same state
+    assert by_wait.status == by_rounds.status
+    assert by_wait.state.countdown == by_rounds.state.countdown
@@ -3,11 +3,9 @@
 from robotsline import commands, handlers, models
 
 
-def test_a_robot_can_be_moved():
+def test_a_robot_can_be_moved(make_factory):
     # Given an idle robot at the cafeteria
-    robot = models.Robot(1, location=models.Location.CAFETERIA)
-    stock = models.Stock([robot])
-    factory = models.RoboticFactory(stock)
+    robot, _, factory = make_factory()
 
     # When I ask her to move to foo_mine
     move_robot = commands.MoveRobot(robot_id=robot.id_, destination="Foo Mine")
@@ -34,11 +32,9 @@ def test_a_moving_robot_cannot_be_rerouted():
     assert robot.state.destination is models.Location.CAFETERIA
 
 
-def test_after_a_move_robot_is_idling_at_destination():
+def test_after_a_move_robot_is_idling_at_destination(make_factory):
     # Given an idle robot at the cafeteria
-    robot = models.Robot(1, location=models.Location.CAFETERIA)
-    stock = models.Stock([robot])
-    factory = models.RoboticFactory(stock)
+    robot, _, factory = make_factory()
 
     # When I ask her to move to foo mine and I wait 5 rounds
     move_robot = commands.MoveRobot(robot_id=robot.id_, destination="Foo Mine")
@@ -49,3 +45,39 @@ def test_after_a_move_robot_is_idling_at_destination():
     # Then robot is idling at foo mine
     assert robot.status == "Idle"
     assert robot.state.location == models.Location.FOO_MINE
+
+
+def test_waiting_a_long_time_after_a_move(make_factory):
+    # Given a robot moving to the foo mine
+    robot, _, factory = make_factory()
+    move_robot = commands.MoveRobot(robot_id=robot.id_, destination="Foo Mine")
+    handlers.execute(move_robot, on_factory=factory)
+
+    # When I wait for hours
+    handlers.execute(commands.Wait(seconds=36_000), on_factory=factory)
+
+    # Then robot is idling at foo mine and the clock went on
+    assert robot.status == "Idle"
+    assert robot.state.location == models.Location.FOO_MINE
+    assert factory.seconds_left == 36_000
+
+
+def test_robots_moving_at_different_times():
+    # Given a robot moving to the foo mine, and another one leaving 2 seconds later
+    first, second = models.Robot(1), models.Robot(2)
+    stock = models.Stock([first, second])
+    factory = models.RoboticFactory(stock)
+    move_first = commands.MoveRobot(robot_id=first.id_, destination="Foo Mine")
+    handlers.execute(move_first, on_factory=factory)
+    handlers.execute(commands.Wait(seconds=2), on_factory=factory)
+    move_second = commands.MoveRobot(robot_id=second.id_, destination="Bar Mine")
+    handlers.execute(move_second, on_factory=factory)
+
+    # When I wait 4 seconds
+    handlers.execute(commands.Wait(seconds=4), on_factory=factory)
+
+    # Then the first robot has arrived, the second one still walks for a second
+    assert first.status == "Idle"
+    assert first.state.location == models.Location.FOO_MINE
+    assert second.status == "Moving"
+    assert second.state.countdown == 1
@@ -11,3 +11,12 @@ def test_new_robots_are_idling():
     # The robot is in IDLE state at the cafeteria
     assert robot.status == "Idle"
     assert robot.state.location == models.Location.CAFETERIA
+
+
+def test_a_moving_robot_is_not_idle():
+    # Given a robot on its way to the foo mine
+    robot = models.Robot(id_=1)
+    robot.state.move(destination=models.Location.FOO_MINE)
+
+    # The robot is not idle anymore
+    assert not robot.is_idle
@@ -4,20 +4,26 @@ import pytest
 
 from robotsline import commands, handlers, models
 
+WAIT_10S = commands.Wait(seconds=10)
+
+# Foobars are plain values, slices of this list give fresh stocks
+_FOOBARS = [models.Foobar() for _ in range(10)]
+
+WRONG_SELL_PLACES = tuple(
+    location
+    for location in models.Location
+    if location is not models.Location.MATERIAL_STORE
+)
+
 
 @pytest.mark.parametrize(
-    "wrong_place",
-    [
-        location
-        for location in models.Location
-        if location is not models.Location.MATERIAL_STORE
-    ],
+    "wrong_place", WRONG_SELL_PLACES, ids=[place.name for place in WRONG_SELL_PLACES]
 )
 def test_selling_at_the_wrong_place(wrong_place: models.Location):
     # Given a factory with enough stock
     # And a robot not in the material store
     robot = models.Robot(id_=1, location=wrong_place)
-    foobar = models.Foobar(models.Foo(), models.Bar(1))
+    foobar = models.Foobar()
     stock = models.Stock([robot], foobars=[foobar])
     factory = models.RoboticFactory(stock=stock)
 
@@ -26,7 +32,7 @@ def test_selling_at_the_wrong_place(wrong_place: models.Location):
     handlers.execute(sell, on_factory=factory)
 
     # Then stock didn't change
-    assert stock.foobars == [foobar]
+    assert list(stock.foobars) == [foobar]
     # and moneybag either
     assert stock.money == 0
     # and robot is idle
@@ -48,8 +54,7 @@ def test_selling_foobars_gave_me_money(
     # Given a factory with some stock
     # And a robot not in the material store
     robot = models.Robot(id_=1, location=models.Location.MATERIAL_STORE)
-    foobars = [models.Foobar(models.Foo(), models.Bar(1)) for _ in range(initial_stock)]
-    stock = models.Stock([robot], foobars=foobars)
+    stock = models.Stock([robot], foobars=_FOOBARS[:initial_stock])
     factory = models.RoboticFactory(stock=stock)
 
     # When I ask her to sell some foobars
@@ -62,6 +67,6 @@ def test_selling_foobars_gave_me_money(
     assert stock.money == 0
 
     # When I wait 10s
-    handlers.execute(commands.Wait(seconds=10), on_factory=factory)
+    handlers.execute(WAIT_10S, on_factory=factory)
     # Then I earned the money
     assert stock.money == final_money
@@ -0,0 +1,27 @@
+"""Test the robots held by a stock"""
+# pylint: disable=missing-docstring
+
+import pytest
+
+from robotsline import models
+
+
+def test_a_robot_belongs_to_a_single_stock():
+    # Given a robot already in a stock
+    robot = models.Robot(id_=1)
+    models.Stock([robot])
+
+    # When I put it in another stock
+    # Then it is refused, the first stock would not see it change anymore
+    with pytest.raises(ValueError):
+        models.Stock([robot])
+
+
+def test_a_robot_is_in_stock_only_once():
+    # Given a robot
+    robot = models.Robot(id_=1)
+
+    # When I put it twice in a stock
+    # Then it is refused, the stock would keep one copy at its old place
+    with pytest.raises(ValueError):
+        models.Stock([robot, robot])